@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from accuweather import AccuWeather
@@ -55,8 +56,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: AccuWeatherConfigEntry)
         UPDATE_INTERVAL_DAILY_FORECAST,
     )
 
-    await coordinator_observation.async_config_entry_first_refresh()
-    await coordinator_daily_forecast.async_config_entry_first_refresh()
+    await asyncio.gather(
+        coordinator_observation.async_config_entry_first_refresh(),
+        coordinator_daily_forecast.async_config_entry_first_refresh(),
+    )
 
     entry.runtime_data = AccuWeatherData(
         coordinator_observation=coordinator_observation,
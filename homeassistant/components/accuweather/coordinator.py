@@ -67,6 +67,7 @@ class AccuWeatherObservationDataUpdateCoordinator(
             config_entry=config_entry,
             name=f"{name} ({coordinator_type})",
             update_interval=update_interval,
+            always_update=False,
         )
 
     async def _async_update_data(self) -> dict[str, Any]:
@@ -111,6 +112,7 @@ class AccuWeatherDailyForecastDataUpdateCoordinator(
             config_entry=config_entry,
             name=f"{name} ({coordinator_type})",
             update_interval=update_interval,
+            always_update=False,
         )
 
     async def _async_update_data(self) -> list[dict[str, Any]]:
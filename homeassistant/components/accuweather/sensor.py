@@ -391,12 +391,12 @@ async def async_setup_entry(
     ]
 
     sensors.extend(
-        [
-            AccuWeatherForecastSensor(forecast_daily_coordinator, description, day)
-            for day in range(MAX_FORECAST_DAYS + 1)
-            for description in FORECAST_SENSOR_TYPES
-            if description.key in forecast_daily_coordinator.data[day]
-        ]
+        AccuWeatherForecastSensor(forecast_daily_coordinator, description, day)
+        for day, forecast in enumerate(
+            forecast_daily_coordinator.data[: MAX_FORECAST_DAYS + 1]
+        )
+        for description in FORECAST_SENSOR_TYPES
+        if description.key in forecast
     )
 
     async_add_entities(sensors)
@@ -420,27 +420,26 @@ class AccuWeatherSensor(
         super().__init__(coordinator)
 
         self.entity_description = description
-        self._sensor_data = self._get_sensor_data(coordinator.data, description.key)
         self._attr_unique_id = f"{coordinator.location_key}-{description.key}".lower()
         self._attr_device_info = coordinator.device_info
-
-    @property
-    def native_value(self) -> str | int | float | None:
-        """Return the state."""
-        return self.entity_description.value_fn(self._sensor_data)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        return self.entity_description.attr_fn(self.coordinator.data)
+        self._async_update_attrs()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
-        self._sensor_data = self._get_sensor_data(
+        self._async_update_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the state and attributes from the coordinator data."""
+        sensor_data = self._get_sensor_data(
             self.coordinator.data, self.entity_description.key
         )
-        self.async_write_ha_state()
+        self._attr_native_value = self.entity_description.value_fn(sensor_data)
+        self._attr_extra_state_attributes = self.entity_description.attr_fn(
+            self.coordinator.data
+        )
 
     @staticmethod
     def _get_sensor_data(
@@ -473,33 +472,30 @@ class AccuWeatherForecastSensor(
         super().__init__(coordinator)
 
         self.entity_description = description
-        self._sensor_data = self._get_sensor_data(
-            coordinator.data, description.key, forecast_day
-        )
         self._attr_unique_id = (
             f"{coordinator.location_key}-{description.key}-{forecast_day}".lower()
         )
         self._attr_device_info = coordinator.device_info
         self._attr_translation_placeholders = {"forecast_day": str(forecast_day)}
         self.forecast_day = forecast_day
-
-    @property
-    def native_value(self) -> str | int | float | None:
-        """Return the state."""
-        return self.entity_description.value_fn(self._sensor_data)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        return self.entity_description.attr_fn(self._sensor_data)
+        self._async_update_attrs()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle data update."""
-        self._sensor_data = self._get_sensor_data(
+        self._async_update_attrs()
+        self.async_write_ha_state()
+
+    @callback
+    def _async_update_attrs(self) -> None:
+        """Update the state and attributes from the coordinator data."""
+        sensor_data = self._get_sensor_data(
             self.coordinator.data, self.entity_description.key, self.forecast_day
         )
-        self.async_write_ha_state()
+        self._attr_native_value = self.entity_description.value_fn(sensor_data)
+        self._attr_extra_state_attributes = self.entity_description.attr_fn(
+            sensor_data
+        )
 
     @staticmethod
     def _get_sensor_data(
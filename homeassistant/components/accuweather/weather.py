@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import cast
+from typing import Any, cast
 
 from homeassistant.components.weather import (
     ATTR_FORECAST_CLOUD_COVERAGE,
@@ -91,6 +91,9 @@ class AccuWeatherEntity(
         self.observation_coordinator = accuweather_data.coordinator_observation
         self.daily_coordinator = accuweather_data.coordinator_daily_forecast
 
+        self._forecast_daily: list[Forecast] = []
+        self._forecast_daily_source: list[dict[str, Any]] | None = None
+
     @property
     def condition(self) -> str | None:
         """Return the current condition."""
@@ -181,6 +184,18 @@ class AccuWeatherEntity(
     @callback
     def _async_forecast_daily(self) -> list[Forecast] | None:
         """Return the daily forecast in native units."""
+        # The coordinator replaces its data on every refresh, so the forecast
+        # only needs to be rebuilt when the source list changes
+        if self._forecast_daily_source is not self.daily_coordinator.data:
+            self._forecast_daily_source = self.daily_coordinator.data
+            self._forecast_daily = self._build_forecast_daily(
+                self._forecast_daily_source
+            )
+        return self._forecast_daily
+
+    @staticmethod
+    def _build_forecast_daily(data: list[dict[str, Any]]) -> list[Forecast]:
+        """Build the daily forecast from the coordinator data."""
         return [
             {
                 ATTR_FORECAST_TIME: utc_from_timestamp(item["EpochDate"]).isoformat(),
@@ -205,5 +220,5 @@ class AccuWeatherEntity(
                 ATTR_FORECAST_WIND_BEARING: item["WindDay"][ATTR_DIRECTION]["Degrees"],
                 ATTR_FORECAST_CONDITION: CONDITION_MAP.get(item["IconDay"]),
             }
-            for item in self.daily_coordinator.data
+            for item in data
         ]
@@ -9,6 +9,7 @@ import pytest
 from syrupy import SnapshotAssertion
 
 from homeassistant.components.accuweather.const import (
+    DOMAIN,
     UPDATE_INTERVAL_DAILY_FORECAST,
     UPDATE_INTERVAL_OBSERVATION,
 )
@@ -28,7 +29,11 @@ from homeassistant.util.unit_system import US_CUSTOMARY_SYSTEM
 
 from . import init_integration
 
-from tests.common import async_fire_time_changed, snapshot_platform
+from tests.common import (
+    async_fire_time_changed,
+    load_json_object_fixture,
+    snapshot_platform,
+)
 
 
 @pytest.mark.usefixtures("entity_registry_enabled_by_default")
@@ -189,9 +194,9 @@ async def test_state_update(
     assert state.state != STATE_UNAVAILABLE
     assert state.state == "3200.0"
 
-    mock_accuweather_client.async_get_current_conditions.return_value["Ceiling"][
-        "Metric"
-    ]["Value"] = 3300
+    current = load_json_object_fixture("current_conditions_data.json", DOMAIN)
+    current["Ceiling"]["Metric"]["Value"] = 3300
+    mock_accuweather_client.async_get_current_conditions.return_value = current
 
     freezer.tick(UPDATE_INTERVAL_OBSERVATION)
     async_fire_time_changed(hass)
@@ -201,3 +206,30 @@ async def test_state_update(
     assert state
     assert state.state != STATE_UNAVAILABLE
     assert state.state == "3300"
+
+
+async def test_state_not_updated_when_data_unchanged(
+    hass: HomeAssistant,
+    mock_accuweather_client: AsyncMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Ensure the sensor state is not written again if the data is unchanged."""
+    entity_id = "sensor.home_cloud_ceiling"
+
+    await init_integration(hass)
+
+    state = hass.states.get(entity_id)
+    assert state
+    assert state.state == "3200.0"
+    last_reported = state.last_reported
+
+    freezer.tick(UPDATE_INTERVAL_OBSERVATION)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert mock_accuweather_client.async_get_current_conditions.call_count == 2
+
+    state = hass.states.get(entity_id)
+    assert state
+    assert state.state == "3200.0"
+    assert state.last_reported == last_reported
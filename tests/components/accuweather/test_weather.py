@@ -1,5 +1,6 @@
 """Test weather of AccuWeather integration."""
 
+from copy import deepcopy
 from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
@@ -164,6 +165,10 @@ async def test_forecast_subscription(
     assert forecast1 != []
     assert forecast1 == snapshot
 
+    forecast = deepcopy(mock_accuweather_client.async_get_daily_forecast.return_value)
+    forecast[0]["TemperatureMax"]["Value"] = 30.0
+    mock_accuweather_client.async_get_daily_forecast.return_value = forecast
+
     freezer.tick(UPDATE_INTERVAL_DAILY_FORECAST + timedelta(seconds=1))
     await hass.async_block_till_done()
     msg = await client.receive_json()